@@ -6,9 +6,10 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from config.default_triggers import DEFAULT_TRIGGERS
-from src.get_news import (deduplicate_articles, fetch_news_by_query,
-                          save_news_to_file)
+from config.default_triggers import DEFAULT_TRIGGERS, UNCLASSIFIED_TRIGGER
+from src.get_news import (append_news_to_jsonl, deduplicate_articles,
+                          fetch_news_by_query, latest_news_partition,
+                          load_recent_news, save_news_to_file)
 
 # Page configuration
 st.set_page_config(
@@ -107,7 +108,9 @@ with st.sidebar:
 
 # Load or fetch news data
 data_file = (
-    "data/sales_triggers.json" if mode == "Sales Triggers" else "data/news_data.json"
+    latest_news_partition("sales_triggers")
+    if mode == "Sales Triggers"
+    else "data/news_data.json"
 )
 news_data = None
 
@@ -159,9 +162,9 @@ if fetch_button:
                         "sort_by": sort_by,
                         "triggers": [name for name, _ in custom_queries],
                     }
-                    save_news_to_file(
+                    append_news_to_jsonl(
                         news_data,
-                        filename="sales_triggers.json",
+                        prefix="sales_triggers",
                         query_params=query_params,
                     )
                     st.success(
@@ -201,10 +204,13 @@ if fetch_button:
             )
 
 # Try to load existing data
-if news_data is None and os.path.exists(data_file):
+if news_data is None and data_file and os.path.exists(data_file):
     try:
-        with open(data_file, "r") as f:
-            loaded_data = json.load(f)
+        if data_file.endswith(".jsonl"):
+            loaded_data = load_recent_news("sales_triggers", days=days_back)
+        else:
+            with open(data_file, "r", encoding="utf-8") as f:
+                loaded_data = json.load(f)
 
         # Check if data has metadata (new format)
         if "metadata" in loaded_data:
@@ -289,7 +295,7 @@ if news_data and news_data.get("status") == "ok":
                 st.subheader("Sales Trigger Distribution")
 
                 # Set category order to match DEFAULT_TRIGGERS
-                trigger_order = list(DEFAULT_TRIGGERS.keys())
+                trigger_order = list(DEFAULT_TRIGGERS.keys()) + [UNCLASSIFIED_TRIGGER]
                 df["trigger_type"] = pd.Categorical(
                     df["trigger_type"], categories=trigger_order, ordered=True
                 )
@@ -5,6 +5,9 @@ These queries can be customized by the sales team to match specific
 target markets, industries, or customer profiles.
 """
 
+import functools
+import re
+
 DEFAULT_TRIGGERS = {
     "Patent & IP": '(company OR startup OR firm OR corporation) AND (patent OR "intellectual property" OR "IP portfolio" OR trademark) AND (granted OR filed OR awarded OR secures)',
     #   "Funding": '(company OR startup) AND ("funding round" OR "Series A" OR "Series B" OR "raises" OR "secures funding" OR "venture capital")',
@@ -15,3 +18,97 @@ DEFAULT_TRIGGERS = {
     # "IPO": '(company OR startup) AND ("IPO" OR "going public" OR "files for IPO" OR "initial public offering" OR "stock listing")',
     "Expansion": '(company OR startup OR firm) AND (expansion OR "opens office" OR "opening" OR "expands into" OR "enters market" OR "new location")',
 }
+
+# Label for articles returned by a combined query that match none of its
+# triggers locally (NewsAPI matched text we only get truncated)
+UNCLASSIFIED_TRIGGER = "Unclassified"
+
+
+@functools.lru_cache(maxsize=256)
+def boolean_to_regex(query):
+    """
+    Convert a NewsAPI boolean query into a regex matching the same articles
+
+    Supports AND, OR, NOT, parentheses, quoted phrases and +/- prefixes.
+    Every clause becomes a lookahead from the start of the text, so use the
+    compiled pattern with .match() and re.DOTALL.
+    """
+    # A +/- prefix stays attached to the quoted phrase it applies to
+    tokens = re.findall(r'[+-]?"[^"]*"|\(|\)|[^\s()"]+', query)
+    pos = 0
+
+    def peek():
+        return tokens[pos] if pos < len(tokens) else None
+
+    def to_assertion(node):
+        kind, rx = node
+        return f"(?=.*{rx})" if kind == "term" else rx
+
+    def parse_or():
+        nonlocal pos
+        nodes = [parse_and()]
+        while peek() == "OR":
+            pos += 1
+            nodes.append(parse_and())
+        if len(nodes) == 1:
+            return nodes[0]
+        if all(kind == "term" for kind, _ in nodes):
+            # Plain alternatives can share a single scan of the text
+            return ("term", "(?:" + "|".join(rx for _, rx in nodes) + ")")
+        return ("assert", "(?:" + "|".join(to_assertion(n) for n in nodes) + ")")
+
+    def parse_and():
+        nonlocal pos
+        nodes = [parse_not()]
+        while peek() not in (None, "OR", ")"):
+            if peek() == "AND":
+                pos += 1
+            nodes.append(parse_not())
+        if len(nodes) == 1:
+            return nodes[0]
+        return ("assert", "".join(to_assertion(n) for n in nodes))
+
+    def parse_not():
+        nonlocal pos
+        token = peek()
+        if token == "NOT":
+            pos += 1
+            return ("assert", f"(?!{to_assertion(parse_not())})")
+        if token and len(token) > 1 and token[0] == "-":
+            tokens[pos] = token[1:]
+            return ("assert", f"(?!{to_assertion(parse_not())})")
+        if token and len(token) > 1 and token[0] == "+":
+            tokens[pos] = token[1:]
+        return parse_atom()
+
+    def parse_atom():
+        nonlocal pos
+        token = peek()
+        if token in (None, ")"):
+            return ("assert", "")  # Empty clause matches anything
+        pos += 1
+        if token == "(":
+            node = parse_or()
+            if peek() == ")":
+                pos += 1
+            return node
+        words = token.strip('"').split()
+        return ("term", r"(?<!\w)" + r"\s+".join(map(re.escape, words)) + r"(?!\w)")
+
+    return to_assertion(parse_or())
+
+
+@functools.lru_cache(maxsize=256)
+def compile_trigger(query):
+    """
+    Compile a trigger query into a pattern for tagging articles; use .match()
+    on title + description + content. Cached, so repeated queries skip parsing
+    and regex compilation.
+    """
+    return re.compile(boolean_to_regex(query), re.IGNORECASE | re.DOTALL)
+
+
+# Compiled once at import; used to tag articles returned by combined queries
+DEFAULT_TRIGGER_PATTERNS = {
+    name: compile_trigger(query) for name, query in DEFAULT_TRIGGERS.items()
+}
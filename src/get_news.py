@@ -1,18 +1,81 @@
-import json
+import atexit
+import hashlib
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import msgpack
+import orjson
+import requests
+from datasketch import MinHash, MinHashLSH
 from dotenv import load_dotenv
 from newsapi import NewsApiClient
-
-from config.default_triggers import DEFAULT_TRIGGERS
+from pybloom_live import ScalableBloomFilter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.default_triggers import (DEFAULT_TRIGGER_PATTERNS,
+                                     DEFAULT_TRIGGERS, UNCLASSIFIED_TRIGGER,
+                                     compile_trigger)
+
+# Paths are resolved once at import
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+CACHE_DIR = os.path.join(DATA_DIR, ".api_cache")
+USAGE_FILE = os.path.join(DATA_DIR, ".api_usage.msgpack")
+LEGACY_USAGE_FILE = os.path.join(DATA_DIR, ".api_usage.json")  # Pre-msgpack format
+SEEN_FILTER_FILE = os.path.join(DATA_DIR, ".seen_urls.bloom")
+TRIGGER_STATS_FILE = os.path.join(DATA_DIR, ".trigger_stats.json")
+os.makedirs(CACHE_DIR, exist_ok=True)
 
 # Load environment variables from config/.env
-config_env_path = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "config", ".env"
+load_dotenv(dotenv_path=os.path.join(BASE_DIR, "config", ".env"))
+
+# Shared session so parallel calls reuse pooled TLS connections to NewsAPI,
+# retrying with backoff on rate limiting and transient server errors
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,  # Let NewsApiClient report the final error
+        ),
+    ),
 )
-load_dotenv(dotenv_path=config_env_path)
-newsapi = NewsApiClient(api_key=os.getenv("NEWS_API_KEY"))
+newsapi = NewsApiClient(api_key=os.getenv("NEWS_API_KEY"), session=session)
+
+# How long fetched news (cached API responses and saved files) stays fresh
+CACHE_TTL_HOURS = 24
+
+# NewsAPI rejects `q` values longer than this
+MAX_QUERY_LENGTH = 500
+
+# Adaptive look-back: aim for about one page of articles per trigger, using a
+# few fixed windows so triggers can still share combined queries
+TARGET_ARTICLES_PER_TRIGGER = 20
+TRIGGER_WINDOW_DAYS = (1, 3, 7, 14, 30)
+
+# Query parameters that only record where a click came from; utm_* is
+# matched by prefix in canonicalize_url
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+
+# API calls are counted in memory and written to the usage file every
+# USAGE_FLUSH_EVERY calls and at exit, instead of rewriting it on every call
+USAGE_FLUSH_EVERY = 10
+_pending_usage = {}  # {date: calls not yet written to the usage file}
+_usage_lock = threading.Lock()
+_usage_file_cache = {"stamp": None, "data": {}}  # Last parsed usage file
+
+_jsonl_lock = threading.Lock()  # Serialises appends to the rolling JSONL files
 
 
 def fetch_news_by_query(
@@ -27,20 +90,21 @@ def fetch_news_by_query(
         days_back: Number of days to look back
         sort_by: Sort order (popularity, publishedAt, relevancy)
     """
-    from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-    to_date = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()
+    from_date = (now - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    to_date = now.strftime("%Y-%m-%d")
     exclude_domains = "arxiv.org,ieee.org,springer.com"  # exclude journal articles
 
     try:
-        response = newsapi.get_everything(
+        response = cached_get_everything(
             q=query,
             from_param=from_date,
             to=to_date,
             sort_by=sort_by,
             language="en",
             exclude_domains=exclude_domains,
+            today=now.date().isoformat(),
         )
-        track_api_usage()  # Track this API call
         return response
     except Exception as e:
         print(f"Error fetching news: {e}")
@@ -69,7 +133,11 @@ def fetch_top_headlines(country="sg", category=None, sources=None):
 
 
 def fetch_sales_triggers(
-    trigger_queries=None, days_back=7, sort_by="publishedAt", region=None
+    trigger_queries=None,
+    days_back=7,
+    sort_by="publishedAt",
+    region=None,
+    adaptive_days=False,
 ):
     """
     Fetch sales trigger news for Patsnap's sales team
@@ -80,51 +148,104 @@ def fetch_sales_triggers(
         days_back: Number of days to look back
         sort_by: Sort order (popularity, publishedAt, relevancy)
         region: Optional region filter (e.g., 'Singapore', 'Asia', 'United States')
+        adaptive_days: Size each trigger's window from its past article yield
+            (see adaptive_days_back); days_back is used for triggers with no history
 
     Returns:
         dict: Combined news data with articles from all sales trigger queries
     """
-    # Use default triggers if none provided
+    # Use default triggers (and their precompiled patterns) if none provided
     if trigger_queries is None:
         trigger_queries = DEFAULT_TRIGGERS
+        trigger_patterns = DEFAULT_TRIGGER_PATTERNS
+    else:
+        trigger_patterns = {
+            name: compile_trigger(query) for name, query in trigger_queries.items()
+        }
 
-    # Add region filter if specified
-    queries_with_region = {}
-    if region:
-        for name, query in trigger_queries.items():
-            queries_with_region[name] = f"({query}) AND {region}"
+    if adaptive_days:
+        trigger_days = adaptive_days_back(
+            trigger_queries, region=region, default=days_back
+        )
     else:
-        queries_with_region = trigger_queries
+        trigger_days = dict.fromkeys(trigger_queries, days_back)
+
+    # Combine triggers sharing a window into as few queries as fit NewsAPI's
+    # length limit; the patterns work out which trigger each article matched
+    packed_queries = []
+    for days in sorted(set(trigger_days.values())):
+        group = {
+            name: query
+            for name, query in trigger_queries.items()
+            if trigger_days[name] == days
+        }
+        for trigger_names, query in pack_trigger_queries(group, region=region):
+            packed_queries.append((trigger_names, query, days))
 
+    # Read the clock once so every query shares the same date boundaries
     all_articles = []
-    from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-    to_date = datetime.now().strftime("%Y-%m-%d")
-
-    for trigger_name, query in queries_with_region.items():
-        try:
-            response = newsapi.get_everything(
+    trigger_yields = {}  # {trigger_name: (articles, days)}
+    now = datetime.now()
+    today = now.date().isoformat()
+    to_date = now.strftime("%Y-%m-%d")
+
+    # Fire all combined queries at once; the calls are I/O-bound so threads suffice
+    with ThreadPoolExecutor(max_workers=max(len(packed_queries), 1)) as ex:
+        futures = {
+            ex.submit(
+                cached_get_everything,
                 q=query,
-                from_param=from_date,
+                from_param=(now - timedelta(days=days)).strftime("%Y-%m-%d"),
                 to=to_date,
                 sort_by=sort_by,
                 language="en",
-            )
-            track_api_usage()  # Track this API call
-
-            if response.get("status") == "ok" and response.get("articles"):
-                # Add source query tag to each article
-                for article in response["articles"]:
-                    article["trigger_type"] = (
-                        trigger_name  # Use short name instead of query
+                today=today,
+            ): (trigger_names, query, days)
+            for trigger_names, query, days in packed_queries
+        }
+
+        for future in as_completed(futures):
+            trigger_names, query, days = futures[future]
+            try:
+                response = future.result()
+                if response.get("status") == "ok":
+                    for name in trigger_names:
+                        trigger_yields[name] = (0, days)
+
+                if response.get("status") == "ok" and response.get("articles"):
+                    # Tag each article with the triggers it matches
+                    for article in response["articles"]:
+                        text = " ".join(
+                            article.get(field) or ""
+                            for field in ("title", "description", "content")
+                        )
+                        matched = [
+                            name
+                            for name in trigger_names
+                            if trigger_patterns[name].match(text)
+                        ]
+                        # NewsAPI searches the full article body, which we only
+                        # get truncated, so some results match no trigger here
+                        article["trigger_type"] = (
+                            matched[0] if matched else UNCLASSIFIED_TRIGGER
+                        )
+                        article["trigger_types"] = matched
+                        for name in matched:
+                            count, _ = trigger_yields[name]
+                            trigger_yields[name] = (count + 1, days)
+                    all_articles.extend(response["articles"])
+                    print(
+                        f"Found {len(response['articles'])} articles for: "
+                        f"{', '.join(trigger_names)}"
                     )
-                all_articles.extend(response["articles"])
-                print(f"Found {len(response['articles'])} articles for: {query}")
-        except Exception as e:
-            print(f"Error fetching news for '{query}': {e}")
-            continue
+            except Exception as e:
+                print(f"Error fetching news for '{query}': {e}")
+                continue
+
+    record_trigger_yields(trigger_yields, region=region)
 
-    # Remove duplicates based on URL
-    unique_articles = deduplicate_articles(all_articles)
+    # Remove duplicates based on URL, then syndicated near-duplicates
+    unique_articles = deduplicate_similar_articles(deduplicate_articles(all_articles))
 
     return {
         "status": "ok",
@@ -133,67 +254,378 @@ def fetch_sales_triggers(
     }
 
 
-# Helper function for API usage tracking
-def track_api_usage():
-    """Track API calls locally to estimate quota usage"""
-    data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-    os.makedirs(data_dir, exist_ok=True)
-    usage_file = os.path.join(data_dir, ".api_usage.json")
+# Helper functions for combining trigger queries
+def pack_trigger_queries(trigger_queries, region=None, max_length=MAX_QUERY_LENGTH):
+    """
+    Combine trigger queries with OR into as few NewsAPI queries as possible,
+    using first-fit bin packing on the query length limit
 
-    today = datetime.now().date().isoformat()
+    Args:
+        trigger_queries: Dict of {trigger_name: query_string}
+        region: Optional region filter ANDed onto every combined query
+        max_length: Maximum length of a combined query
+
+    Returns:
+        list: [(trigger_names, combined_query), ...]
+    """
+    region_suffix = f" AND {region}" if region else ""
+    budget = max_length - (len(region_suffix) + 2 if region else 0)
+
+    bins = []  # [trigger_names, query_parts, length]
+    for name, query in trigger_queries.items():
+        part = f"({query})"
+        for b in bins:
+            if b[2] + len(" OR ") + len(part) <= budget:
+                b[0].append(name)
+                b[1].append(part)
+                b[2] += len(" OR ") + len(part)
+                break
+        else:
+            # Queries longer than the budget get a bin of their own
+            bins.append([[name], [part], len(part)])
+
+    packed = []
+    for names, parts, _ in bins:
+        combined = " OR ".join(parts)
+        if region:
+            combined = f"({combined}){region_suffix}"
+        packed.append((names, combined))
+    return packed
+
+
+# Helper functions for adaptive per-trigger look-back windows
+def adaptive_days_back(trigger_names, region=None, default=7):
+    """
+    Pick a look-back window per trigger from its historical daily article yield,
+    so busy triggers search fewer days and quiet ones search more
+
+    Args:
+        trigger_names: Iterable of trigger names
+        region: Region filter the fetch uses; yields are tracked per region
+        default: Window for triggers with no recorded yield yet
+
+    Returns:
+        dict: {trigger_name: days}
+    """
+    stats = load_trigger_stats()
+    trigger_days = {}
+    for name in trigger_names:
+        per_day = stats.get(trigger_stats_key(name, region))
+        if per_day is None:
+            trigger_days[name] = default
+            continue
+        if per_day == 0:
+            # Nothing found recently: search as far back as allowed
+            trigger_days[name] = TRIGGER_WINDOW_DAYS[-1]
+            continue
+        wanted = TARGET_ARTICLES_PER_TRIGGER / per_day
+        trigger_days[name] = next(
+            (days for days in TRIGGER_WINDOW_DAYS if days >= wanted),
+            TRIGGER_WINDOW_DAYS[-1],
+        )
+    return trigger_days
+
+
+def trigger_stats_key(name, region=None):
+    """Key for a trigger's yield in the stats file; regional runs are kept apart"""
+    return f"{name} @ {region}" if region else name
 
-    # Load existing usage
-    usage_data = {}
-    if os.path.exists(usage_file):
+
+def load_trigger_stats():
+    """Load average articles per day for each trigger"""
+    if os.path.exists(TRIGGER_STATS_FILE):
         try:
-            with open(usage_file, "r") as f:
-                usage_data = json.load(f)
+            with open(TRIGGER_STATS_FILE, "rb") as f:
+                return orjson.loads(f.read())
+        except:
+            pass
+    return {}
+
+
+def record_trigger_yields(trigger_yields, region=None):
+    """
+    Fold the latest article counts into each trigger's average daily yield
+
+    Args:
+        trigger_yields: Dict of {trigger_name: (articles, days)}
+        region: Region filter the counts were fetched with
+    """
+    if not trigger_yields:
+        return
+    stats = load_trigger_stats()
+    for name, (articles, days) in trigger_yields.items():
+        key = trigger_stats_key(name, region)
+        per_day = articles / max(days, 1)  # days_back=0 still covers today
+        # Exponential moving average so recent fetches count the most
+        stats[key] = 0.5 * stats[key] + 0.5 * per_day if key in stats else per_day
+
+    tmp_file = TRIGGER_STATS_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, TRIGGER_STATS_FILE)
+
+
+# Helper functions for caching API responses
+def cached_get_everything(today=None, **params):
+    """
+    Call newsapi.get_everything, reusing a response saved on disk if the same
+    query was made within CACHE_TTL_HOURS. Only real API calls are tracked.
+
+    Args:
+        today: ISO date to count the API call under (defaults to today)
+        **params: Keyword arguments passed through to newsapi.get_everything
+    """
+    key = hashlib.sha1(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, f"{key}.json")
+
+    if os.path.exists(cache_file):
+        age_seconds = time.time() - os.path.getmtime(cache_file)
+        if age_seconds < CACHE_TTL_HOURS * 3600:
+            try:
+                with open(cache_file, "rb") as f:
+                    return orjson.loads(f.read())
+            except:
+                pass  # Unreadable cache entry, fall through to the API
+
+    response = newsapi.get_everything(**params)
+    track_api_usage(today)  # Track this API call
+
+    if response.get("status") == "ok":
+        prune_api_cache()
+        # Write to a temp file and swap it in so readers never see a partial entry
+        tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(response))
+            os.replace(tmp_file, cache_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+    return response
+
+
+def prune_api_cache():
+    """Delete cached API responses (and stray temp files) older than CACHE_TTL_HOURS"""
+    cutoff = time.time() - CACHE_TTL_HOURS * 3600
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass  # Removed by another thread or process
+
+
+def clear_api_cache():
+    """Delete all cached API responses so the next fetch hits NewsAPI"""
+    removed = 0
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".json"):
+                os.remove(os.path.join(CACHE_DIR, name))
+                removed += 1
+    print(f"Cleared {removed} cached API responses")
+    return removed
+
+
+# Helper functions for API usage tracking
+def track_api_usage(today=None):
+    """
+    Track API calls locally to estimate quota usage
+
+    Args:
+        today: ISO date to count the call under; read from the clock if not given
+    """
+    if today is None:
+        today = datetime.now().date().isoformat()
+
+    with _usage_lock:
+        _pending_usage[today] = _pending_usage.get(today, 0) + 1
+        pending_calls = sum(_pending_usage.values())
+
+    if pending_calls >= USAGE_FLUSH_EVERY:
+        flush_api_usage()
+
+
+@atexit.register
+def flush_api_usage():
+    """Merge pending API call counts into the usage file"""
+    with _usage_lock:
+        if not _pending_usage:
+            return
+
+        # Load existing usage
+        try:
+            usage_data = load_usage_file()
         except:
             usage_data = {}
 
-    # Update today's count
-    if today not in usage_data:
-        usage_data[today] = 0
-    usage_data[today] += 1
+        # Add pending counts
+        for day, calls in _pending_usage.items():
+            usage_data[day] = usage_data.get(day, 0) + calls
+        _pending_usage.clear()
+
+        # Clean up old entries (keep last 7 days only)
+        cutoff_date = (datetime.now() - timedelta(days=7)).date().isoformat()
+        usage_data = {k: v for k, v in usage_data.items() if k >= cutoff_date}
+
+        # Save atomically so a crash mid-write never leaves a corrupt file
+        tmp_file = USAGE_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            msgpack.pack(usage_data, f)
+        os.replace(tmp_file, USAGE_FILE)
 
-    # Clean up old entries (keep last 7 days only)
-    cutoff_date = (datetime.now() - timedelta(days=7)).date().isoformat()
-    usage_data = {k: v for k, v in usage_data.items() if k >= cutoff_date}
+        # Its counts now live in the msgpack file
+        if os.path.exists(LEGACY_USAGE_FILE):
+            os.remove(LEGACY_USAGE_FILE)
 
-    # Save
-    with open(usage_file, "w") as f:
-        json.dump(usage_data, f, indent=2)
+
+def load_usage_file():
+    """
+    Read the saved usage counts, falling back to the JSON file written before
+    the switch to msgpack so today's count carries over
+    """
+    if os.path.exists(USAGE_FILE):
+        with open(USAGE_FILE, "rb") as f:
+            return msgpack.unpack(f, raw=False)
+    if os.path.exists(LEGACY_USAGE_FILE):
+        with open(LEGACY_USAGE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    return {}
 
 
 def get_api_usage_today():
-    """Get number of API calls made today"""
-    data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-    usage_file = os.path.join(data_dir, ".api_usage.json")
+    """Get number of API calls made today, including ones not yet flushed"""
     today = datetime.now().date().isoformat()
 
-    if os.path.exists(usage_file):
+    # Hold the lock across both reads so a concurrent flush cannot move calls
+    # from pending into the file in between and have them counted twice
+    with _usage_lock:
+        pending = _pending_usage.get(today, 0)
+
+        # Only re-read the usage file when it has changed since the last call
+        usage_path = USAGE_FILE if os.path.exists(USAGE_FILE) else LEGACY_USAGE_FILE
         try:
-            with open(usage_file, "r") as f:
-                usage_data = json.load(f)
-                return usage_data.get(today, 0)
-        except:
-            return 0
-    return 0
+            stamp = (usage_path, os.stat(usage_path).st_mtime)
+        except OSError:
+            return pending
+        if stamp != _usage_file_cache["stamp"]:
+            try:
+                _usage_file_cache["data"] = load_usage_file()
+                _usage_file_cache["stamp"] = stamp
+            except:
+                return pending
+        return _usage_file_cache["data"].get(today, 0) + pending
 
 
 # Helper function to deduplicate articles
-def deduplicate_articles(articles):
-    """Remove duplicate articles based on URL"""
+def deduplicate_articles(articles, seen_filter=None):
+    """
+    Remove duplicate articles based on canonical URL (see canonicalize_url)
+
+    Args:
+        articles: List of article dicts
+        seen_filter: Optional Bloom filter of URLs from earlier batches (see
+            load_seen_filter). Articles already in it are dropped and new URLs
+            are added to it. Duplicates within the batch are always caught
+            exactly by a set, whether or not a filter is given
+    """
+    # set.add returns None, so "not seen_add(key)" records the URL and passes;
+    # ScalableBloomFilter.add returns True if the URL was (probably) there
     seen_urls = set()
+    seen_add = seen_urls.add
+    filter_add = seen_filter.add if seen_filter is not None else None
+    return [
+        article
+        for article in articles
+        if (url := article.get("url"))
+        and (key := canonicalize_url(url)) not in seen_urls
+        and not seen_add(key)
+        and not (filter_add and filter_add(key))
+    ]
+
+
+def canonicalize_url(url):
+    """
+    Normalise an article URL for deduplication: lowercase scheme and host,
+    drop tracking parameters, the fragment and any trailing slash
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key not in TRACKING_PARAMS and not key.startswith("utm_")
+        ]
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            query,
+            "",
+        )
+    )
+
+
+def deduplicate_similar_articles(articles, threshold=0.85, num_perm=128):
+    """
+    Remove near-duplicate articles (e.g. the same story syndicated on several
+    domains) using MinHash-LSH over title + description shingles.
+    Run after deduplicate_articles so exact URL repeats never reach MinHash.
+
+    Args:
+        articles: List of article dicts with unique URLs
+        threshold: Estimated Jaccard similarity above which articles count as duplicates
+        num_perm: Number of MinHash permutations
+    """
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
     unique = []
-    for article in articles:
-        url = article.get("url")
-        if url and url not in seen_urls:
-            seen_urls.add(url)
+    for i, article in enumerate(articles):
+        text = f"{article.get('title') or ''} {article.get('description') or ''}"
+        text = " ".join(text.lower().split())
+        if len(text) < 5:
             unique.append(article)
+            continue
+
+        # Character 5-gram shingles
+        m = MinHash(num_perm=num_perm)
+        m.update_batch({text[j : j + 5].encode("utf-8") for j in range(len(text) - 4)})
+        if lsh.query(m):
+            continue
+        lsh.insert(article.get("url") or str(i), m)
+        unique.append(article)
     return unique
 
 
+def load_seen_filter(path=SEEN_FILTER_FILE):
+    """Load the persisted Bloom filter of seen article URLs, or start a new one"""
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                return ScalableBloomFilter.fromfile(f)
+        except Exception as e:
+            print(f"Error loading seen URL filter, starting fresh: {e}")
+    return ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+
+
+def save_seen_filter(seen_filter, path=SEEN_FILTER_FILE):
+    """Persist the Bloom filter of seen article URLs next to the usage file"""
+    tmp_file = path + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            seen_filter.tofile(f)
+        os.replace(tmp_file, path)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    return path
+
+
 def save_news_to_file(news_data, filename="news_data.json", query_params=None):
     """
     Save news data to a JSON file in the data directory with metadata
@@ -204,31 +636,177 @@ def save_news_to_file(news_data, filename="news_data.json", query_params=None):
         query_params: Optional dict of query parameters used (days_back, region, etc.)
     """
     if news_data:
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-        os.makedirs(data_dir, exist_ok=True)
-
         # Add metadata
         fetched_at = datetime.now()
-        data_with_metadata = {
-            "metadata": {
-                "fetched_at": fetched_at.isoformat(),
-                "expires_at": (fetched_at + timedelta(hours=24)).isoformat(),
-                "query_params": query_params or {},
-            },
+        metadata = {
+            "fetched_at": fetched_at.isoformat(),
+            "expires_at": (fetched_at + timedelta(hours=CACHE_TTL_HOURS)).isoformat(),
+            "query_params": query_params or {},
+        }
+        header = {
+            "metadata": metadata,
             "status": news_data.get("status"),
             "totalResults": news_data.get("totalResults"),
-            "articles": news_data.get("articles", []),
         }
 
-        filepath = os.path.join(data_dir, filename)
-        with open(filepath, "w") as f:
-            json.dump(data_with_metadata, f, indent=2)
+        # Stream articles one at a time so only the current article is held in
+        # memory as a serialised string; write to a temp file and swap it in so
+        # readers never see a half-written file
+        filepath = os.path.join(DATA_DIR, filename)
+        tmp_file = f"{filepath}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(header)[:-1])
+                f.write(b', "articles": [\n')
+                for i, article in enumerate(news_data.get("articles", [])):
+                    if i:
+                        f.write(b",\n")
+                    f.write(orjson.dumps(article))
+                f.write(b"\n]}\n")
+            os.replace(tmp_file, filepath)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
         print(f"News data saved to {filepath}")
-
         return filepath
     return None
 
 
+def append_news_to_jsonl(news_data, prefix="sales_triggers", query_params=None):
+    """
+    Append new articles to today's rolling JSON Lines file, one article per line
+    (data/{prefix}_{YYYY-MM-DD}.jsonl). Articles already in the file are skipped,
+    as are articles stored on an earlier day according to the persisted seen-URL
+    filter (see load_seen_filter), so each article lives in the partition of the
+    day it was first fetched. Fetch metadata for the latest run goes in a
+    .meta.json sidecar.
+
+    Args:
+        news_data: The news data dict from API
+        prefix: File name prefix for the partition
+        query_params: Optional dict of query parameters used (days_back, region, etc.)
+    """
+    if not news_data:
+        return None
+
+    fetched_at = datetime.now()
+    base_path = os.path.join(DATA_DIR, f"{prefix}_{fetched_at.date().isoformat()}")
+    filepath = base_path + ".jsonl"
+
+    with _jsonl_lock:
+        # Articles already in today's file are ruled out exactly; the global
+        # filter then drops those first stored on an earlier day without
+        # reading the older partitions
+        existing_urls = (
+            {canonicalize_url(a["url"]) for a in iter_jsonl(filepath) if a.get("url")}
+            if os.path.exists(filepath)
+            else set()
+        )
+        candidates = [
+            article
+            for article in deduplicate_articles(news_data.get("articles", []))
+            if canonicalize_url(article["url"]) not in existing_urls
+        ]
+        seen_filter = load_seen_filter()
+        new_articles = deduplicate_articles(candidates, seen_filter=seen_filter)
+
+        with open(filepath, "ab") as f:
+            for article in new_articles:
+                f.write(orjson.dumps(article) + b"\n")
+        # Save the filter after appending, so a crash in between can at worst
+        # let an article be stored again on a later day
+        save_seen_filter(seen_filter)
+
+        metadata = {
+            "fetched_at": fetched_at.isoformat(),
+            "expires_at": (fetched_at + timedelta(hours=CACHE_TTL_HOURS)).isoformat(),
+            "query_params": query_params or {},
+        }
+        tmp_file = base_path + ".meta.json.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, base_path + ".meta.json")
+
+    print(
+        f"Appended {len(new_articles)} new articles to {filepath} "
+        f"({len(candidates) - len(new_articles)} already stored on earlier days)"
+    )
+    return filepath
+
+
+def iter_jsonl(filepath):
+    """Yield articles from a JSON Lines file one at a time"""
+    with open(filepath, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def news_partitions(prefix="sales_triggers"):
+    """Return the paths of the {prefix}_{YYYY-MM-DD}.jsonl files, oldest first"""
+    pattern = re.compile(rf"{re.escape(prefix)}_\d{{4}}-\d{{2}}-\d{{2}}\.jsonl")
+    if not os.path.isdir(DATA_DIR):
+        return []
+    return [
+        os.path.join(DATA_DIR, name)
+        for name in sorted(os.listdir(DATA_DIR))
+        if pattern.fullmatch(name)
+    ]
+
+
+def latest_news_partition(prefix="sales_triggers"):
+    """Return the path of the most recent {prefix}_{YYYY-MM-DD}.jsonl file, if any"""
+    partitions = news_partitions(prefix)
+    return partitions[-1] if partitions else None
+
+
+def load_news_from_jsonl(filepath):
+    """
+    Load a rolling JSON Lines file (and its metadata sidecar, if present) into
+    the same shape save_news_to_file writes
+
+    Args:
+        filepath: Path to a file written by append_news_to_jsonl
+    """
+    articles = list(iter_jsonl(filepath))
+    news_data = {"status": "ok", "totalResults": len(articles), "articles": articles}
+
+    meta_file = filepath[: -len(".jsonl")] + ".meta.json"
+    if os.path.exists(meta_file):
+        with open(meta_file, "rb") as f:
+            news_data["metadata"] = orjson.loads(f.read())
+    return news_data
+
+
+def load_recent_news(prefix="sales_triggers", days=7):
+    """
+    Load the partitions from the `days` days up to and including the latest one,
+    newest first, with the latest run's metadata. Each article is stored only in
+    the partition of the day it was first fetched (see append_news_to_jsonl)
+
+    Args:
+        prefix: File name prefix of the partitions
+        days: Number of days of partitions to load
+    """
+    partitions = news_partitions(prefix)
+    if not partitions:
+        return None
+
+    def partition_date(path):
+        return os.path.basename(path)[len(prefix) + 1 : -len(".jsonl")]
+
+    latest = datetime.fromisoformat(partition_date(partitions[-1]))
+    cutoff = (latest - timedelta(days=days)).date().isoformat()
+
+    news_data = load_news_from_jsonl(partitions[-1])
+    for path in reversed(partitions[:-1]):
+        if partition_date(path) <= cutoff:
+            break
+        news_data["articles"].extend(iter_jsonl(path))
+    news_data["totalResults"] = len(news_data["articles"])
+    return news_data
+
+
 if __name__ == "__main__":
     print("Fetching sales trigger news for Patsnap (Singapore focus)...")
     print("=" * 50)
@@ -241,8 +819,12 @@ if __name__ == "__main__":
         print(f"Total Unique Articles: {news.get('totalResults')}")
         print(f"Articles Retrieved: {len(news.get('articles', []))}")
 
-        # Save to file
-        save_news_to_file(news, filename="sales_triggers.json")
+        # Append to today's rolling file
+        append_news_to_jsonl(
+            news,
+            prefix="sales_triggers",
+            query_params={"days_back": 7, "region": "Singapore"},
+        )
 
         # Print first 3 articles as examples
         if news.get("articles"):
@@ -0,0 +1,35 @@
+import pytest
+
+from config.default_triggers import compile_trigger
+
+CASES = [
+    # (query, text, should match)
+    ("patent", "New patent filed", True),
+    ("patent", "Patents filed", False),
+    ("patent AND lawsuit", "Patent lawsuit settled", True),
+    ("patent AND lawsuit", "Patent granted", False),
+    ("patent lawsuit", "Lawsuit over a patent", True),
+    ("patent OR trademark", "Trademark dispute", True),
+    ("patent OR trademark", "Copyright dispute", False),
+    ("patent NOT expired", "Patent granted", True),
+    ("patent NOT expired", "Patent expired", False),
+    ("patent -expired", "Patent expired", False),
+    ("patent -expired", "Patent granted", True),
+    ('"product launch"', "The product  launch went well", True),
+    ('"product launch"', "Launch of a product", False),
+    ('launch -"soft launch"', "Hard launch next week", True),
+    ('launch -"soft launch"', "Soft launch next week", False),
+    ('+"series a" funding', "Series A funding closed", True),
+    ('+"series a" funding', "Series B funding closed", False),
+    ("(patent OR trademark) AND (filed OR granted)", "Trademark granted", True),
+    ("(patent OR trademark) AND (filed OR granted)", "Trademark revoked", False),
+    ("expansion AND NOT (layoffs OR closure)", "Expansion into Asia", True),
+    ("expansion AND NOT (layoffs OR closure)", "Expansion halted by closure", False),
+    ("((a OR b) AND (c OR (d AND e)))", "b then d and e", True),
+    ("((a OR b) AND (c OR (d AND e)))", "b then d only", False),
+]
+
+
+@pytest.mark.parametrize("query, text, expected", CASES)
+def test_compile_trigger(query, text, expected):
+    assert bool(compile_trigger(query).match(text)) is expected